@@ -9,9 +9,12 @@ For use with the 5G-MONARCH project and Open5GS.
 Latency and Jitter calculations depend on an external Blackbox Exporter.
 """
 import os
+import asyncio
 import logging
+import threading
 import time
-import requests
+import httpx
+import orjson
 import prometheus_client as prom
 import argparse
 
@@ -23,160 +26,257 @@ DEFAULT_UPDATE_PERIOD = 1
 UPDATE_PERIOD = int(os.environ.get('UPDATE_PERIOD', DEFAULT_UPDATE_PERIOD))
 EXPORTER_PORT = 9000
 TIME_RANGE = os.getenv("TIME_RANGE", "5s")
-
-
-# Prometheus variables
-SLICE_THROUGHPUT = prom.Gauge('slice_throughput', 'throughput per slice (bits/sec)', ['snssai', 'seid', 'direction'])
-SLICE_PACKET_LOSS = prom.Gauge('slice_packet_loss_ratio', 'packet loss ratio per slice', ['snssai', 'direction'])
-SLICE_LATENCY = prom.Gauge('slice_latency_seconds', 'average latency per slice', ['snssai'])
-SLICE_JITTER = prom.Gauge('slice_jitter_seconds', 'jitter per slice', ['snssai'])
+DEFAULT_ACTIVE_SNSSAI_TTL = 30
+ACTIVE_SNSSAI_TTL = float(os.environ.get('ACTIVE_SNSSAI_TTL', DEFAULT_ACTIVE_SNSSAI_TTL))
+DEFAULT_KPI_CACHE_MAX_AGE = 30
+KPI_CACHE_MAX_AGE = float(os.environ.get('KPI_CACHE_MAX_AGE', DEFAULT_KPI_CACHE_MAX_AGE))
+DEFAULT_KPI_CACHE_MAX_SIZE = 10000
+KPI_CACHE_MAX_SIZE = int(os.environ.get('KPI_CACHE_MAX_SIZE', DEFAULT_KPI_CACHE_MAX_SIZE))
+
+# Shared async HTTP client so all per-tick queries are fired concurrently
+# on a single event loop thread. HTTP/2 multiplexes the queries over one
+# keep-alive connection to Thanos, avoiding per-query TCP/TLS handshakes,
+# thread stacks and GIL contention.
+# Explicit connect/read timeouts plus one connect retry bound each query's
+# worst-case wall time, so a stalled Thanos fast-fails instead of hanging
+# the KPI loop and eating the whole tick budget.
+_ACLIENT = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        retries=1,
+    ),
+    timeout=httpx.Timeout(5.0, connect=2.0),
+    headers={'Accept': 'application/json'},
+)
+
+
+# PromQL query templates and direction mappings, built once at import time
+# instead of re-doing the string formatting work on every call.
+_DIRECTION_MAPPING = {
+    "uplink": "outdatavolumen3upf",
+    "downlink": "indatavolumen3upf"
+}
+_DIRECTION_MAPPING_PACKETS = {
+    "uplink": "ul_packets",
+    "downlink": "dl_packets"
+}
+_DIRECTION_MAPPING_DROPPED = {
+    "uplink": "ul_packets_dropped",
+    "downlink": "dl_packets_dropped"
+}
+
+_THROUGHPUT_QUERY_TMPL = (
+    'sum by (snssai, seid) (rate(fivegs_ep_n3_gtp_{metric}_seid[{tr}]) '
+    '* on (seid) group_right sum(fivegs_smffunction_sm_seid_session) by (seid, snssai)) * 8'
+)
+_PACKET_LOSS_QUERY_TMPL = (
+    '(sum(rate(fivegs_ep_n3_gtp_{dropped}_total[{tr}])) by (instance) '
+    '* on(instance) group_right '
+    'sum(upf_smf_association) by (instance, snssai))'
+    '/ on(instance, snssai) '
+    '(sum(rate(fivegs_ep_n3_gtp_{packets}_total[{tr}])) by (instance) '
+    '* on(instance) group_right '
+    'sum(upf_smf_association) by (instance, snssai))'
+)
+# Latency and jitter aggregate over the same probe range selector, which is
+# built once per call and interpolated into both halves of the query. The
+# halves are joined with `or` and tagged with a synthetic "kpi" label via
+# label_replace, so both KPIs come back in one request.
+_PROBE_RANGE_SELECTOR_TMPL = 'probe_duration_seconds[{tr}]'
+_LATENCY_JITTER_QUERY_TMPL = (
+    'label_replace(avg_over_time({selector}), "kpi", "latency", "", "") '
+    'or label_replace(stddev_over_time({selector}), "kpi", "jitter", "", "")'
+)
+_ACTIVE_SNSSAI_QUERY_TMPL = 'sum by (snssai) (rate(fivegs_smffunction_sm_seid_session[{tr}]))'
+
+
+# Prometheus variables. The gauges live in a private registry that scrapes
+# never see directly; the refresh loop snapshots it into the cached
+# collector below, so scrape rate and Thanos query rate are independent.
+_KPI_REGISTRY = prom.CollectorRegistry()
+SLICE_THROUGHPUT = prom.Gauge('slice_throughput', 'throughput per slice (bits/sec)', ['snssai', 'seid', 'direction'], registry=_KPI_REGISTRY)
+SLICE_PACKET_LOSS = prom.Gauge('slice_packet_loss_ratio', 'packet loss ratio per slice', ['snssai', 'direction'], registry=_KPI_REGISTRY)
+SLICE_LATENCY = prom.Gauge('slice_latency_seconds', 'average latency per slice', ['snssai'], registry=_KPI_REGISTRY)
+SLICE_JITTER = prom.Gauge('slice_jitter_seconds', 'jitter per slice', ['snssai'], registry=_KPI_REGISTRY)
 
 # get rid of bloat
 prom.REGISTRY.unregister(prom.PROCESS_COLLECTOR)
 prom.REGISTRY.unregister(prom.PLATFORM_COLLECTOR)
 prom.REGISTRY.unregister(prom.GC_COLLECTOR)
 
-def query_prometheus(params, url):
+
+class CachedKpiCollector:
+    """
+    Serves the last KPI snapshot to Prometheus scrapes, so a scrape never
+    triggers new Thanos queries. The background KPI loop calls refresh()
+    after each tick; snapshots older than KPI_CACHE_MAX_AGE are considered
+    stale and withheld from scrapes instead of served as fresh data.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = []
+        self._ts = 0.0
+
+    def refresh(self):
+        families = list(_KPI_REGISTRY.collect())
+        num_samples = sum(len(family.samples) for family in families)
+        if num_samples > KPI_CACHE_MAX_SIZE:
+            log.warning("KPI snapshot has %d samples (KPI_CACHE_MAX_SIZE=%d), truncating", num_samples, KPI_CACHE_MAX_SIZE)
+            remaining = KPI_CACHE_MAX_SIZE
+            for family in families:
+                family.samples = family.samples[:remaining]
+                remaining -= len(family.samples)
+        with self._lock:
+            self._snapshot = families
+            self._ts = time.monotonic()
+
+    def collect(self):
+        with self._lock:
+            if time.monotonic() - self._ts > KPI_CACHE_MAX_AGE:
+                return []
+            return self._snapshot
+
+
+_KPI_COLLECTOR = CachedKpiCollector()
+prom.REGISTRY.register(_KPI_COLLECTOR)
+
+# Cache of label children so the hot path hits .set() directly instead of
+# going through .labels() (dict lookup + label validation) every update.
+_THROUGHPUT_CHILDREN = {}    # {(snssai, seid, direction): child gauge}
+_PACKET_LOSS_CHILDREN = {}   # {(snssai, direction): child gauge}
+_LATENCY_CHILDREN = {}       # {snssai: child gauge}
+_JITTER_CHILDREN = {}        # {snssai: child gauge}
+
+async def query_prometheus(params, url):
     """
-    Query Prometheus using requests and return value.
+    Query Prometheus using httpx and return value.
     params: The parameters for the Prometheus query.
     url: The URL of the Prometheus server.
     Returns: The result of the Prometheus query.
     """
     try:
-        r = requests.get(url + '/api/v1/query', params)
-        data = r.json()
+        r = await _ACLIENT.get(url + '/api/v1/query', params=params)
+        # orjson is much faster than the stdlib parser, which matters when
+        # Thanos returns many SEIDs across slices
+        data = orjson.loads(r.content)
 
         results = data["data"]["result"]
         return results
-        
-    except requests.exceptions.RequestException as e:
-        log.error(f"Failed to query Prometheus: {e}")
+
+    except httpx.HTTPError as e:
+        log.error("Failed to query Prometheus: %s", e)
     except (KeyError, IndexError, ValueError) as e:
-        log.error(f"Failed to parse Prometheus response: {e}")
+        log.error("Failed to parse Prometheus response: %s", e)
         log.warning("No data available!")
     return [] # Return empty list on failure
 
-def get_slice_throughput_per_seid_and_direction(snssai, direction):
+async def get_all_throughput(direction):
     """
-    Queries both the SMF and UPF to get the throughput per SEID and direction.
-    Returns a dictionary of the form {seid: value (bits/sec)}
+    Queries both the SMF and UPF to get the throughput for all active slices
+    in a single batched query, fanning out via `by (snssai, seid)`.
+    Returns a dictionary of the form {(snssai, seid): value (bits/sec)}
     """
-    time_range = TIME_RANGE
-    throughput_per_seid = {}  # {seid: value (bits/sec)}
-
-    direction_mapping = {
-        "uplink": "outdatavolumen3upf",
-        "downlink": "indatavolumen3upf"
-    }
-
-    if direction not in direction_mapping:
+    if direction not in _DIRECTION_MAPPING:
         log.error("Invalid direction")
-        return
+        return {}
 
-    query = f'sum by (seid) (rate(fivegs_ep_n3_gtp_{direction_mapping[direction]}_seid[{time_range}]) * on (seid) group_right sum(fivegs_smffunction_sm_seid_session{{snssai="{snssai}"}}) by (seid, snssai)) * 8'
+    query = _THROUGHPUT_QUERY_TMPL.format(metric=_DIRECTION_MAPPING[direction], tr=TIME_RANGE)
     log.debug(query)
     params = {'query': query}
-    results = query_prometheus(params, MONARCH_THANOS_URL)
-
-    if results:
-        for result in results:
-            seid = result["metric"]["seid"]
-            value = float(result["value"][1])
-            throughput_per_seid[seid] = value
+    results = await query_prometheus(params, MONARCH_THANOS_URL)
 
-    return throughput_per_seid
+    # {(snssai, seid): value (bits/sec)}; a comprehension sizes the dict
+    # up-front and handles empty results naturally
+    return {
+        (result["metric"]["snssai"], result["metric"]["seid"]): float(result["value"][1])
+        for result in results
+    }
 
-def get_slice_packet_loss(snssai, direction):
+async def get_all_packet_loss(direction):
     """
-    计算每个切片的丢包率。
+    一次性计算所有活跃切片的丢包率。
     返回一个字典 {snssai: value (ratio)}
     """
-    time_range = TIME_RANGE
-    packet_loss_per_slice = {}
-
-    direction_mapping_packets = {
-        "uplink": "ul_packets",
-        "downlink": "dl_packets"
-    }
-    direction_mapping_dropped = {
-        "uplink": "ul_packets_dropped",
-        "downlink": "dl_packets_dropped"
-    }
-
-    if direction not in direction_mapping_packets:
+    if direction not in _DIRECTION_MAPPING_PACKETS:
         log.error("Invalid direction for packet loss")
-        return packet_loss_per_slice
+        return {}
 
-    # PromQL查询: (丢包速率 / 总包速率)，如果总包速率为0则结果为0
+    # PromQL查询: (丢包速率 / 总包速率)，通过 `by (snssai, instance)` 一次覆盖所有切片
     # 我们通过 smf function 关联，确保只计算属于该切片的流量
     # 注意: 此处假设存在一个 upf_smf_association 指标用于关联UPF实例和SNSSAI
-    query = (
-        f'(sum(rate(fivegs_ep_n3_gtp_{direction_mapping_dropped[direction]}_total[{time_range}])) by (instance) '
-        f'and on(instance) '
-        f'sum(upf_smf_association{{snssai="{snssai}"}}) by (instance))'
-        f'/ on(instance) '
-        f'(sum(rate(fivegs_ep_n3_gtp_{direction_mapping_packets[direction]}_total[{time_range}])) by (instance) '
-        f'and on(instance) '
-        f'sum(upf_smf_association{{snssai="{snssai}"}}) by (instance))'
+    query = _PACKET_LOSS_QUERY_TMPL.format(
+        dropped=_DIRECTION_MAPPING_DROPPED[direction],
+        packets=_DIRECTION_MAPPING_PACKETS[direction],
+        tr=TIME_RANGE
     )
-    
+
     log.debug(query)
     params = {'query': query}
-    results = query_prometheus(params, MONARCH_THANOS_URL)
-
-    if results:
-        # 假设一个切片只有一个UPF，直接取第一个结果
-        value = float(results[0]["value"][1])
-        packet_loss_per_slice[snssai] = value
+    results = await query_prometheus(params, MONARCH_THANOS_URL)
 
-    return packet_loss_per_slice
+    # 假设一个切片只有一个UPF，每个切片直接取最后一个结果
+    return {result["metric"]["snssai"]: float(result["value"][1]) for result in results}
 
-def get_slice_latency_and_jitter(snssai):
+async def get_all_latency_and_jitter():
     """
-    从 Blackbox Exporter 获取延迟和抖动。
-    返回两个字典: {snssai: latency}, {snssai: jitter}
+    从 Blackbox Exporter 一次性获取所有切片的延迟和抖动。
+    返回两个字典: {slice_id: latency}, {slice_id: jitter}
+    (slice_id 为 Blackbox Exporter 标签格式, 即 snssai 中 '-' 替换为 '_')
     """
-    time_range = TIME_RANGE
-    latency_per_slice = {}
-    jitter_per_slice = {}
-
-    # 假设 Blackbox Exporter 暴露的指标带有 'slice_id' 标签
-    # 我们将 snssai 中的 '-' 替换为 '_' 来匹配标签格式
-    slice_label_value = snssai.replace('-', '_')
-
-    # 计算平均延迟
-    latency_query = f'avg_over_time(probe_duration_seconds{{slice_id="{slice_label_value}"}}[{time_range}])'
-    log.debug(latency_query)
-    latency_params = {'query': latency_query}
-    latency_results = query_prometheus(latency_params, MONARCH_THANOS_URL)
-
-    if latency_results:
-        value = float(latency_results[0]["value"][1])
-        latency_per_slice[snssai] = value
-
-    # 计算抖动 (延迟的标准差)
-    jitter_query = f'stddev_over_time(probe_duration_seconds{{slice_id="{slice_label_value}"}}[{time_range}])'
-    log.debug(jitter_query)
-    jitter_params = {'query': jitter_query}
-    jitter_results = query_prometheus(jitter_params, MONARCH_THANOS_URL)
-
-    if jitter_results:
-        value = float(jitter_results[0]["value"][1])
-        jitter_per_slice[snssai] = value
-        
+    range_selector = _PROBE_RANGE_SELECTOR_TMPL.format(tr=TIME_RANGE)
+
+    # 延迟 (平均值) 和抖动 (标准差) 合并为一条查询, 通过 "kpi" 标签区分
+    # (不过滤 slice_id, 每个切片每个KPI返回一个序列)
+    query = _LATENCY_JITTER_QUERY_TMPL.format(selector=range_selector)
+    log.debug(query)
+    params = {'query': query}
+    results = await query_prometheus(params, MONARCH_THANOS_URL)
+
+    latency_per_slice = {
+        result["metric"]["slice_id"]: float(result["value"][1])
+        for result in results if result["metric"]["kpi"] == "latency"
+    }
+    jitter_per_slice = {
+        result["metric"]["slice_id"]: float(result["value"][1])
+        for result in results if result["metric"]["kpi"] == "jitter"
+    }
     return latency_per_slice, jitter_per_slice
    
-def get_active_snssais():
+# Dispatch table of all per-tick KPI queries: (kind, direction, fetcher).
+# run_kpi_computation iterates this once to build the query batch and again
+# to route results to the right exporter, instead of hand-rolled loops per
+# KPI class.
+_KPI_SPECS = [
+    ("throughput", "uplink", get_all_throughput),
+    ("throughput", "downlink", get_all_throughput),
+    ("packet_loss", "uplink", get_all_packet_loss),
+    ("packet_loss", "downlink", get_all_packet_loss),
+    ("latency_jitter", None, get_all_latency_and_jitter),
+]
+
+# The active SNSSAI set changes on the order of session lifetimes (minutes),
+# so there is no point re-querying Thanos for it every tick.
+_ACTIVE_SNSSAI_CACHE = {"ts": 0.0, "val": []}
+
+async def get_active_snssais():
     """
     Return a list of active SNSSAIs from the SMF.
+    Results are cached for ACTIVE_SNSSAI_TTL seconds to avoid a Thanos
+    round trip every tick.
     """
-    time_range = TIME_RANGE
-    query = f'sum by (snssai) (rate(fivegs_smffunction_sm_seid_session[{time_range}]))'
+    if _ACTIVE_SNSSAI_CACHE["val"] and time.monotonic() - _ACTIVE_SNSSAI_CACHE["ts"] < ACTIVE_SNSSAI_TTL:
+        return _ACTIVE_SNSSAI_CACHE["val"]
+
+    query = _ACTIVE_SNSSAI_QUERY_TMPL.format(tr=TIME_RANGE)
     log.debug(query)
     params = {'query': query}
-    results = query_prometheus(params, MONARCH_THANOS_URL)
+    results = await query_prometheus(params, MONARCH_THANOS_URL)
     active_snssais = [result["metric"]["snssai"] for result in results]
+    if active_snssais:
+        _ACTIVE_SNSSAI_CACHE["val"] = active_snssais
+        _ACTIVE_SNSSAI_CACHE["ts"] = time.monotonic()
     return active_snssais
 
 def main():
@@ -186,57 +286,100 @@ def main():
         log.error("MONARCH_THANOS_URL is not set")
         return 
 
-    log.info(f"Monarch Thanos URL: {MONARCH_THANOS_URL}")
-    log.info(f"Time range: {TIME_RANGE}")
-    log.info(f"Update period: {UPDATE_PERIOD}")
+    log.info("Monarch Thanos URL: %s", MONARCH_THANOS_URL)
+    log.info("Time range: %s", TIME_RANGE)
+    log.info("Update period: %s", UPDATE_PERIOD)
     prom.start_http_server(EXPORTER_PORT)
 
+    # The KPI loop runs on a background thread (inside a single asyncio.run
+    # so the client's pooled connections stay bound to one event loop);
+    # scrapes are served from the cached snapshot and never block on Thanos.
+    refresh_thread = threading.Thread(target=lambda: asyncio.run(kpi_loop()), name="kpi-refresh", daemon=True)
+    refresh_thread.start()
+    refresh_thread.join()
+
+async def kpi_loop():
+    # Align ticks to a monotonic deadline instead of sleeping a fixed
+    # UPDATE_PERIOD after each computation, so the effective period does not
+    # drift upward with per-tick query time.
+    next_deadline = time.monotonic()
     while True:
         try:
-            run_kpi_computation()
+            await run_kpi_computation()
+            _KPI_COLLECTOR.refresh()
         except Exception as e:
-            log.error(f"Failing to run KPI computation: {e}")
-        time.sleep(UPDATE_PERIOD)
+            log.error("Failing to run KPI computation: %s", e)
+        next_deadline += UPDATE_PERIOD
+        delay = next_deadline - time.monotonic()
+        if delay < 0:
+            log.warning("KPI tick overran its %ss period by %.3fs, skipping missed slots", UPDATE_PERIOD, -delay)
+            next_deadline = time.monotonic()
+            delay = 0.0
+        await asyncio.sleep(delay)
 
 def export_to_prometheus(snssai, seid, direction, value):
     value_mbits = round(value / 10 ** 6, 6)
-    log.info(f"SNSSAI={snssai} | SEID={seid} | DIR={direction:8s} | RATE (Mbps)={value_mbits}")
-    SLICE_THROUGHPUT.labels(snssai=snssai, seid=seid, direction=direction).set(value)
+    log.info("SNSSAI=%s | SEID=%s | DIR=%-8s | RATE (Mbps)=%s", snssai, seid, direction, value_mbits)
+    key = (snssai, seid, direction)
+    child = _THROUGHPUT_CHILDREN.get(key)
+    if child is None:
+        child = SLICE_THROUGHPUT.labels(snssai=snssai, seid=seid, direction=direction)
+        _THROUGHPUT_CHILDREN[key] = child
+    child.set(value)
 
 def export_packet_loss_to_prometheus(snssai, direction, value):
-    log.info(f"SNSSAI={snssai} | DIR={direction:8s} | PKT_LOSS_RATIO={value:.6f}")
-    SLICE_PACKET_LOSS.labels(snssai=snssai, direction=direction).set(value)
+    log.info("SNSSAI=%s | DIR=%-8s | PKT_LOSS_RATIO=%.6f", snssai, direction, value)
+    key = (snssai, direction)
+    child = _PACKET_LOSS_CHILDREN.get(key)
+    if child is None:
+        child = SLICE_PACKET_LOSS.labels(snssai=snssai, direction=direction)
+        _PACKET_LOSS_CHILDREN[key] = child
+    child.set(value)
 
 def export_latency_jitter_to_prometheus(snssai, latency, jitter):
-    log.info(f"SNSSAI={snssai} | LATENCY (s)={latency:.6f} | JITTER (s)={jitter:.6f}")
-    SLICE_LATENCY.labels(snssai=snssai).set(latency)
-    SLICE_JITTER.labels(snssai=snssai).set(jitter)
-
-def run_kpi_computation():
-    directions = ["uplink", "downlink"]
-    active_snssais = get_active_snssais()
+    log.info("SNSSAI=%s | LATENCY (s)=%.6f | JITTER (s)=%.6f", snssai, latency, jitter)
+    latency_child = _LATENCY_CHILDREN.get(snssai)
+    if latency_child is None:
+        latency_child = SLICE_LATENCY.labels(snssai=snssai)
+        _LATENCY_CHILDREN[snssai] = latency_child
+    latency_child.set(latency)
+    jitter_child = _JITTER_CHILDREN.get(snssai)
+    if jitter_child is None:
+        jitter_child = SLICE_JITTER.labels(snssai=snssai)
+        _JITTER_CHILDREN[snssai] = jitter_child
+    jitter_child.set(jitter)
+
+async def run_kpi_computation():
+    active_snssais = await get_active_snssais()
     if not active_snssais:
         log.warning("No active SNSSAIs found")
         return
-    
-    log.debug(f"Active SNSSAIs: {active_snssais}")
-    for snssai in active_snssais:
-        # 计算和导出吞吐量
-        for direction in directions:
-            throughput_per_seid = get_slice_throughput_per_seid_and_direction(snssai, direction)
-            for seid, value in throughput_per_seid.items():
+
+    log.debug("Active SNSSAIs: %s", active_snssais)
+
+    # 每类KPI一条批量查询 (按方向各一条)，由 `by (snssai, ...)` 在服务端展开所有切片；
+    # 所有查询由 _KPI_SPECS 驱动，通过 asyncio.gather 并发发出，结果按序导出
+    coros = [fetch(direction) if direction is not None else fetch()
+             for _, direction, fetch in _KPI_SPECS]
+    results = await asyncio.gather(*coros, return_exceptions=True)
+
+    for (kind, direction, _), result in zip(_KPI_SPECS, results):
+        if isinstance(result, Exception):
+            log.error("KPI query failed (kind=%s, direction=%s): %s", kind, direction, result)
+            continue
+
+        if kind == "throughput":
+            for (snssai, seid), value in result.items():
                 export_to_prometheus(snssai, seid, direction, value)
-        
-        # 计算和导出丢包率
-        for direction in directions:
-            packet_loss_per_slice = get_slice_packet_loss(snssai, direction)
-            for slice_id, value in packet_loss_per_slice.items():
+        elif kind == "packet_loss":
+            for slice_id, value in result.items():
                 export_packet_loss_to_prometheus(slice_id, direction, value)
-
-        # 计算和导出延迟和抖动
-        latency_per_slice, jitter_per_slice = get_slice_latency_and_jitter(snssai)
-        if snssai in latency_per_slice and snssai in jitter_per_slice:
-            export_latency_jitter_to_prometheus(snssai, latency_per_slice[snssai], jitter_per_slice[snssai])
+        else:
+            latency_per_slice, jitter_per_slice = result
+            for snssai in active_snssais:
+                slice_label_value = snssai.replace('-', '_')
+                if slice_label_value in latency_per_slice and slice_label_value in jitter_per_slice:
+                    export_latency_jitter_to_prometheus(snssai, latency_per_slice[slice_label_value], jitter_per_slice[slice_label_value])
 
 
 if __name__ == "__main__":